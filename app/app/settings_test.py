@@ -0,0 +1,17 @@
+"""
+Django settings for running the test suite against SQLite.
+
+Use with `python manage.py test --settings=app.settings_test` for a fast
+local run; the default settings keep testing against PostgreSQL.
+
+The image ships SQLite 3.34, where bulk_create() does not set primary keys
+on the objects it returns; tests must not rely on those ids.
+"""
+from app.settings import *  # noqa: F401, F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
@@ -4,20 +4,28 @@ Test for models.
 from unittest.mock import patch
 from decimal import Decimal
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 
 from core import models
 
 
+MD5_PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
 def create_user(email='user@example.com', password='testpass123'):
     """Create and return a new user."""
     return get_user_model().objects.create_user(email, password)
 
 
+@override_settings(PASSWORD_HASHERS=MD5_PASSWORD_HASHERS)
 class ModelTests(TestCase):
     """Test models."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
     def test_create_user_with_email_successful(self):
         """Test creating user with an email is successful"""
         email = 'test@example.com'
@@ -39,9 +47,17 @@ class ModelTests(TestCase):
             ['test4@example.com', 'test4@example.com'],
         ]
 
+        user_manager = get_user_model().objects
         for email, expected_email in sample_emails:
-            user = get_user_model().objects.create_user(email, 'sample123')
-            self.assertEqual(user.email, expected_email)
+            with self.subTest(email=email):
+                self.assertEqual(
+                    user_manager.normalize_email(email),
+                    expected_email
+                )
+
+        email, expected_email = sample_emails[0]
+        user = user_manager.create_user(email, 'sample123')
+        self.assertEqual(user.email, expected_email)
 
     def test_new_user_without_email_raises_error(self):
         """Test that creating an user without an email raises a ValueError"""
@@ -67,12 +83,8 @@ class ModelTests(TestCase):
 
     def test_create_recipe(self):
         """Test creating a recipe with successful."""
-        user = get_user_model().objects.create_user(
-            'test@example.com',
-            'testpass123'
-        )
         recipe = models.Recipe.objects.create(
-            user=user,
+            user=self.user,
             title='Sample recipe name',
             time_minutes=5,
             price=Decimal('5.50'),
@@ -83,16 +95,14 @@ class ModelTests(TestCase):
 
     def test_create_tag(self):
         """Test creating a tag is successful."""
-        user = create_user()
-        tag = models.Tag.objects.create(user=user, name='Tag1')
+        tag = models.Tag.objects.create(user=self.user, name='Tag1')
 
         self.assertEqual(str(tag), tag.name)
 
     def test_create_ingredient(self):
         """Test creating a ingredient is successful."""
-        user = create_user()
         ingredient = models.Ingredient.objects.create(
-            user=user,
+            user=self.user,
             name='Ingredient1'
         )
 
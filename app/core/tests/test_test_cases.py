@@ -0,0 +1,37 @@
+"""
+Tests for the test suite configuration.
+"""
+import unittest
+
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+
+
+def iter_test_case_classes(suite):
+    """Yield the class of every test in a (nested) test suite."""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_test_case_classes(test)
+        else:
+            yield type(test)
+
+
+class TestCaseBaseTests(SimpleTestCase):
+    """Test database tests roll back instead of flushing tables."""
+
+    def test_database_tests_use_transactional_test_case(self):
+        """Test database-backed test cases inherit from TestCase."""
+        suite = unittest.defaultTestLoader.discover(
+            start_dir=str(settings.BASE_DIR),
+            top_level_dir=str(settings.BASE_DIR),
+        )
+        test_cases = {
+            test_case
+            for test_case in iter_test_case_classes(suite)
+            if issubclass(test_case, TransactionTestCase)
+        }
+
+        self.assertTrue(test_cases)
+        for test_case in sorted(test_cases, key=lambda cls: cls.__qualname__):
+            with self.subTest(test_case=test_case.__qualname__):
+                self.assertTrue(issubclass(test_case, TestCase))
@@ -2,13 +2,14 @@
 Tests for recipe APIs.
 """
 from decimal import Decimal
+from functools import lru_cache
 import tempfile
+import shutil
 import os
 
-from PIL import Image
-
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
 from rest_framework import status
@@ -27,19 +28,41 @@ from recipe.serializers import (
 
 RECIPES_URL = reverse('recipe:recipe-list')
 
+MD5_PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# Keep uploaded test media in RAM when tmpfs is available.
+MEDIA_TEST_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# A precomputed 1x1 grayscale JPEG, so the tests do not need to encode one.
+_TINY_JPEG = bytes.fromhex(
+    'ffd8ffe000104a46494600010100000100010000ffdb004300ffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffc0000b080001'
+    '000101011100ffc4001f00000105010101010101000000000000000001020304'
+    '05060708090a0bffc400b5100002010303020403050504040000017d01020300'
+    '041105122131410613516107227114328191a1082342b1c11552d1f024336272'
+    '82090a161718191a25262728292a3435363738393a434445464748494a535455'
+    '565758595a636465666768696a737475767778797a838485868788898a929394'
+    '95969798999aa2a3a4a5a6a7a8a9aab2b3b4b5b6b7b8b9bac2c3c4c5c6c7c8c9'
+    'cad2d3d4d5d6d7d8d9dae1e2e3e4e5e6e7e8e9eaf1f2f3f4f5f6f7f8f9faffda'
+    '0008010100003f008ebfffd9'
+)
+
 
+@lru_cache(maxsize=None)
 def detail_url(recipe_id):
     """Create and return a recipe defailt URL."""
     return reverse('recipe:recipe-detail', args=[recipe_id])
 
 
+@lru_cache(maxsize=None)
 def image_upload_url(recipe_id):
     """Create and return an image upload URL."""
     return reverse('recipe:recipe-upload-image', args=[recipe_id])
 
 
-def create_recipe(user, **params):
-    """Create and return a sample recipe."""
+def build_recipe(user, **params):
+    """Build and return an unsaved sample recipe."""
     defaults = {
         'title': 'Sample recipe title',
         'time_minutes': 22,
@@ -49,10 +72,28 @@ def create_recipe(user, **params):
     }
     defaults.update(params)
 
-    recipe = Recipe.objects.create(user=user, **defaults)
+    return Recipe(user=user, **defaults)
+
+
+def create_recipe(user, **params):
+    """Create and return a sample recipe."""
+    recipe = build_recipe(user, **params)
+    recipe.save()
     return recipe
 
 
+def create_recipes(user, n=2, **params):
+    """
+    Create n sample recipes with a single query.
+
+    The returned objects may not have ids (SQLite < 3.35), so only use this
+    for rows the test does not touch again.
+    """
+    return Recipe.objects.bulk_create(
+        [build_recipe(user, **params) for _ in range(n)]
+    )
+
+
 def create_user(**params):
     """Create and return a new user."""
     return get_user_model().objects.create_user(**params)
@@ -71,45 +112,82 @@ class PublicRecipeAPITests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@override_settings(PASSWORD_HASHERS=MD5_PASSWORD_HASHERS)
 class PrivateRecipeAPITests(TestCase):
     """Test authenticated API requests."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(email='user@example.com', password='pass123')
+        cls.other_user = create_user(
+            email='other@example.com',
+            password='pass123',
+        )
+        # Read-only recipe owned by another user; tests that mutate recipes
+        # create their own.
+        cls.other_user_recipe = create_recipe(user=cls.other_user)
+        cls.tag_breakfast = Tag.objects.create(user=cls.user, name='Breakfast')
+        cls.tag_lunch = Tag.objects.create(user=cls.user, name='Lunch')
+        cls.tag_dessert = Tag.objects.create(user=cls.user, name='Dessert')
+        cls.ingredient_salt = Ingredient.objects.create(
+            user=cls.user,
+            name='Salt',
+        )
+        cls.ingredient_pepper = Ingredient.objects.create(
+            user=cls.user,
+            name='Pepper',
+        )
+        cls.ingredient_lemon = Ingredient.objects.create(
+            user=cls.user,
+            name='Lemon',
+        )
+        cls._client = APIClient()
+        cls._client.force_authenticate(cls.user)
+
     def setUp(self):
-        self.client = APIClient()
-        self.user = create_user(email='user@example.com', password='pass123')
-        self.client.force_authenticate(self.user)
+        # Reuse the class client; accessing it through the class avoids
+        # the per-test deepcopy Django applies to setUpTestData attributes.
+        self.client = type(self)._client
+
+    def assert_matches_recipes(self, response, recipes):
+        """Assert the response lists exactly the given recipes."""
+        serializer = RecipeSerializer(recipes, many=True)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, serializer.data)
 
     def test_retrive_recipes(self):
         """Test retrieving a list of recipes."""
-        create_recipe(user=self.user)
-        create_recipe(user=self.user)
+        create_recipes(user=self.user)
 
-        response = self.client.get(RECIPES_URL)
+        # One query for the recipes and one prefetch per relation.
+        with self.assertNumQueries(3):
+            response = self.client.get(RECIPES_URL)
 
-        recipes = Recipe.objects.all().order_by('-id')
-        serializer = RecipeSerializer(recipes, many=True)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        recipes = Recipe.objects.filter(
+            user=self.user
+        ).order_by('-id').prefetch_related('tags', 'ingredients')
+        self.assert_matches_recipes(response, recipes)
 
     def test_recipe_list_limited_to_user(self):
         """Test list of recipe is limited to authenticated user."""
-        other_user = create_user(email='other@example.com', password='pass13')
-        create_recipe(user=other_user)
         create_recipe(user=self.user)
 
         response = self.client.get(RECIPES_URL)
 
-        recipes = Recipe.objects.filter(user=self.user)
-        serializer = RecipeSerializer(recipes, many=True)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        recipes = Recipe.objects.filter(user=self.user).prefetch_related(
+            'tags',
+            'ingredients',
+        )
+        self.assert_matches_recipes(response, recipes)
 
     def test_get_recipe_detail(self):
         """Test get recipe detail."""
         recipe = create_recipe(user=self.user)
 
         url = detail_url(recipe.id)
-        response = self.client.get(url)
+        # One query for the recipe and one prefetch per relation.
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
 
         serializer = RecipeDetailSerializer(recipe)
         self.assertEqual(response.data, serializer.data)
@@ -176,54 +254,51 @@ class PrivateRecipeAPITests(TestCase):
 
     def test_update_user_returns_error(self):
         """Test changing the recipe user results in an error."""
-        new_user = create_user(email='other@example.com', password='pass123')
         recipe = create_recipe(self.user)
 
         url = detail_url(recipe.id)
-        payload = {'user': new_user.id}
+        payload = {'user': self.other_user.id}
         response = self.client.patch(url, payload)
         recipe.refresh_from_db()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(recipe.user, self.user)
 
-    def test_update_with_not_allowed_user_returns_error(self):
-        """
-        Test changing the recipe with not allowed user results in an error.
-        """
-        new_user = create_user(email='other@example.com', password='pass123')
-        recipe = create_recipe(new_user)
-
-        url = detail_url(recipe.id)
-        payload = {
-            'title': 'New recipe title',
-            'link': 'https://newlink.com/recipe.pdf',
-            'description': 'New description',
-            'time_minutes': 10,
-            'price': Decimal('2.50')
-        }
-        response = self.client.put(url, payload)
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-
     def test_delete_recipe(self):
         """Test deleting a recipe successful."""
         recipe = create_recipe(self.user)
 
         url = detail_url(recipe.id)
-        response = self.client.delete(url)
+        # Fetch the recipe, clear both relations and delete the row; the
+        # tags and ingredients are not prefetched.
+        with self.assertNumQueries(4):
+            response = self.client.delete(url)
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(Recipe.objects.filter(id=recipe.id).exists())
 
-    def test_recipe_other_users_recipe_error(self):
-        """Test trying to delete another users recipe gives error."""
-        new_user = create_user(email='other@example.com', password='test123')
-        recipe = create_recipe(user=new_user)
+    def test_other_users_recipe_error(self):
+        """
+        Test changing or deleting another users recipe results in an error.
+        """
+        url = detail_url(self.other_user_recipe.id)
+        payload = {
+            'title': 'New recipe title',
+            'link': 'https://newlink.com/recipe.pdf',
+            'description': 'New description',
+            'time_minutes': 10,
+            'price': Decimal('2.50')
+        }
 
-        url = detail_url(recipe.id)
-        response = self.client.delete(url)
+        for method in ['patch', 'put', 'delete']:
+            with self.subTest(method=method):
+                response = getattr(self.client, method)(url, payload)
+                self.assertEqual(
+                    response.status_code,
+                    status.HTTP_404_NOT_FOUND
+                )
 
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-        self.assertTrue(Recipe.objects.filter(id=recipe.id).exists())
+        recipe = Recipe.objects.get(id=self.other_user_recipe.id)
+        self.assertEqual(recipe.title, self.other_user_recipe.title)
 
     def test_create_recipe_with_new_tags(self):
         """Test creating a recipe with new tags."""
@@ -236,20 +311,20 @@ class PrivateRecipeAPITests(TestCase):
         response = self.client.post(RECIPES_URL, payload, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        recipes = Recipe.objects.filter(user=self.user)
-        self.assertEqual(len(recipes), 1)
-        recipe = recipes[0]
-        self.assertEqual(recipe.tags.count(), 2)
-        for tag in payload['tags']:
-            exists = recipe.tags.filter(
-                name=tag['name'],
-                user=self.user
-            ).exists()
-            self.assertTrue(exists)
+        recipe = Recipe.objects.prefetch_related(
+            'tags'
+        ).get(id=response.data['id'])
+        self.assertEqual(recipe.user_id, self.user.id)
+        tags = recipe.tags.all()
+        self.assertEqual(len(tags), 2)
+        tag_names = {tag.name for tag in tags if tag.user_id == self.user.id}
+        self.assertEqual(
+            tag_names,
+            {tag['name'] for tag in payload['tags']}
+        )
 
     def test_create_recipe_existing_tags(self):
         """Test creating a recipe with existing tag."""
-        tag_indian = Tag.objects.create(user=self.user, name='Indian')
         payload = {
             'title': 'Pongal',
             'time_minutes': 60,
@@ -259,55 +334,48 @@ class PrivateRecipeAPITests(TestCase):
         response = self.client.post(RECIPES_URL, payload, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        recipes = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipes.count(), 1)
-        recipe = recipes[0]
-        self.assertEqual(recipe.tags.count(), 2)
-        self.assertIn(tag_indian, recipe.tags.all())
-        for tag in payload['tags']:
-            exists = recipe.tags.filter(
-                name=tag['name'],
-                user=self.user
-            ).exists()
-            self.assertTrue(exists)
-        exists = Tag.objects.filter(
-            name=tag_indian.name,
-            user=self.user,
-            ).exists()
-        self.assertTrue(exists)
+        recipe = Recipe.objects.prefetch_related(
+            'tags'
+        ).get(id=response.data['id'])
+        self.assertEqual(recipe.user_id, self.user.id)
+        tags = recipe.tags.all()
+        self.assertEqual(len(tags), 2)
+        self.assertIn(self.tag_breakfast, tags)
+        tag_names = {tag.name for tag in tags if tag.user_id == self.user.id}
+        self.assertEqual(
+            tag_names,
+            {tag['name'] for tag in payload['tags']}
+        )
 
     def test_create_tag_on_update(self):
         """Test creating tag when updating a recipe."""
         recipe = create_recipe(user=self.user)
 
-        payload = {'tags': [{'name': 'Lunch'}]}
+        payload = {'tags': [{'name': 'Dinner'}]}
         url = detail_url(recipe.id)
         response = self.client.patch(url, payload, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        new_tag = Tag.objects.get(user=self.user, name='Lunch')
+        new_tag = Tag.objects.get(user=self.user, name='Dinner')
         self.assertIn(new_tag, recipe.tags.all())
 
     def test_update_recipe_assign_tag(self):
         """Test assigning an existing tag when updating a recipe."""
-        tag_breakfast = Tag.objects.create(user=self.user, name='Breakfast')
         recipe = create_recipe(user=self.user)
-        recipe.tags.add(tag_breakfast)
+        recipe.tags.add(self.tag_breakfast)
 
-        tag_lunch = Tag.objects.create(user=self.user, name='Lunch')
         payload = {'tags': [{'name': 'Lunch'}]}
         url = detail_url(recipe.id)
         response = self.client.patch(url, payload, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn(tag_lunch, recipe.tags.all())
-        self.assertNotIn(tag_breakfast, recipe.tags.all())
+        self.assertIn(self.tag_lunch, recipe.tags.all())
+        self.assertNotIn(self.tag_breakfast, recipe.tags.all())
 
     def test_clear_recipe_tags(self):
         """Test clearing a recipes tags."""
-        tag = Tag.objects.create(user=self.user, name='Dessert')
         recipe = create_recipe(user=self.user)
-        recipe.tags.add(tag)
+        recipe.tags.add(self.tag_dessert)
 
         payload = {'tags': []}
         url = detail_url(recipe.id)
@@ -322,25 +390,29 @@ class PrivateRecipeAPITests(TestCase):
             'title': 'Cauliflower Tacos',
             'time_minutes': 60,
             'price': Decimal('4.30'),
-            'ingredients': [{'name': 'Califlower'}, {'name': 'Salt'}],
+            'ingredients': [{'name': 'Califlower'}, {'name': 'Lime'}],
         }
         response = self.client.post(RECIPES_URL, payload, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        recipes = Recipe.objects.filter(user=self.user)
-        self.assertEqual(len(recipes), 1)
-        recipe = recipes[0]
-        self.assertEqual(recipe.ingredients.count(), 2)
-        for ingredient in payload['ingredients']:
-            exists = recipe.ingredients.filter(
-                name=ingredient['name'],
-                user=self.user
-            ).exists()
-            self.assertTrue(exists)
+        recipe = Recipe.objects.prefetch_related(
+            'ingredients'
+        ).get(id=response.data['id'])
+        self.assertEqual(recipe.user_id, self.user.id)
+        ingredients = recipe.ingredients.all()
+        self.assertEqual(len(ingredients), 2)
+        ingredient_names = {
+            ingredient.name
+            for ingredient in ingredients
+            if ingredient.user_id == self.user.id
+        }
+        self.assertEqual(
+            ingredient_names,
+            {ingredient['name'] for ingredient in payload['ingredients']}
+        )
 
     def test_create_recipe_existing_ingredients(self):
         """Test creating a recipe with existing ingredient."""
-        salt = Ingredient.objects.create(user=self.user, name='Salt')
         payload = {
             'title': 'Cauliflower Tacos',
             'time_minutes': 60,
@@ -351,55 +423,52 @@ class PrivateRecipeAPITests(TestCase):
         response = self.client.post(RECIPES_URL, payload, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        recipes = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipes.count(), 1)
-        recipe = recipes[0]
-        self.assertEqual(recipe.ingredients.count(), 2)
-        self.assertIn(salt, recipe.ingredients.all())
-        for ingredient in payload['ingredients']:
-            exists = recipe.ingredients.filter(
-                name=ingredient['name'],
-                user=self.user
-            ).exists()
-            self.assertTrue(exists)
-        exists = Ingredient.objects.filter(
-            name=salt.name,
-            user=self.user,
-            ).exists()
-        self.assertTrue(exists)
+        recipe = Recipe.objects.prefetch_related(
+            'ingredients'
+        ).get(id=response.data['id'])
+        self.assertEqual(recipe.user_id, self.user.id)
+        ingredients = recipe.ingredients.all()
+        self.assertEqual(len(ingredients), 2)
+        self.assertIn(self.ingredient_salt, ingredients)
+        ingredient_names = {
+            ingredient.name
+            for ingredient in ingredients
+            if ingredient.user_id == self.user.id
+        }
+        self.assertEqual(
+            ingredient_names,
+            {ingredient['name'] for ingredient in payload['ingredients']}
+        )
 
     def test_create_ingredient_on_update(self):
         """Test creating ingredient when updating a recipe."""
         recipe = create_recipe(user=self.user)
 
-        payload = {'ingredients': [{'name': 'Salt'}]}
+        payload = {'ingredients': [{'name': 'Cumin'}]}
         url = detail_url(recipe.id)
         response = self.client.patch(url, payload, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        new_ingredient = Ingredient.objects.get(user=self.user, name='Salt')
+        new_ingredient = Ingredient.objects.get(user=self.user, name='Cumin')
         self.assertIn(new_ingredient, recipe.ingredients.all())
 
     def test_update_recipe_assign_ingredient(self):
         """Test assigning an existing ingredient when updating a recipe."""
-        salt = Ingredient.objects.create(user=self.user, name='Salt')
         recipe = create_recipe(user=self.user)
-        recipe.ingredients.add(salt)
+        recipe.ingredients.add(self.ingredient_salt)
 
-        pepper = Ingredient.objects.create(user=self.user, name='Pepper')
         payload = {'ingredients': [{'name': 'Pepper'}]}
         url = detail_url(recipe.id)
         response = self.client.patch(url, payload, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn(pepper, recipe.ingredients.all())
-        self.assertNotIn(salt, recipe.ingredients.all())
+        self.assertIn(self.ingredient_pepper, recipe.ingredients.all())
+        self.assertNotIn(self.ingredient_salt, recipe.ingredients.all())
 
     def test_clear_recipe_ingredients(self):
         """Test clearing a recipes ingredients."""
-        ingredient = Ingredient.objects.create(user=self.user, name='Lemon')
         recipe = create_recipe(user=self.user)
-        recipe.ingredients.add(ingredient)
+        recipe.ingredients.add(self.ingredient_lemon)
 
         payload = {'ingredients': []}
         url = detail_url(recipe.id)
@@ -412,55 +481,69 @@ class PrivateRecipeAPITests(TestCase):
         """Test filtering by tags."""
         recipe1 = create_recipe(user=self.user, title='Thai Vegetable Curry')
         recipe2 = create_recipe(user=self.user, title='Aubergine with Tahini')
+        recipe3 = create_recipe(user=self.user, title='Fish and Chips')
         tag1 = Tag.objects.create(user=self.user, name='Vegan')
         tag2 = Tag.objects.create(user=self.user, name='Vegetarian')
         recipe1.tags.add(tag1)
         recipe2.tags.add(tag2)
-        recipe3 = create_recipe(user=self.user, title='Fish and Chips')
 
         params = {'tags': f'{tag1.id},{tag2.id}'}
-        response = self.client.get(RECIPES_URL, params)
-
-        serializer1 = RecipeSerializer(recipe1)
-        serializer2 = RecipeSerializer(recipe2)
-        serializer3 = RecipeSerializer(recipe3)
-        self.assertIn(serializer1.data, response.data)
-        self.assertIn(serializer2.data, response.data)
-        self.assertNotIn(serializer3.data, response.data)
+        with self.assertNumQueries(3):
+            response = self.client.get(RECIPES_URL, params)
+
+        serializer = RecipeSerializer([recipe1, recipe2, recipe3], many=True)
+        recipe1_data, recipe2_data, recipe3_data = serializer.data
+        self.assertIn(recipe1_data, response.data)
+        self.assertIn(recipe2_data, response.data)
+        self.assertNotIn(recipe3_data, response.data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_filter_by_ingredients(self):
         """Test filtering by ingredients."""
         recipe1 = create_recipe(user=self.user, title='Thai Vegetable Curry')
         recipe2 = create_recipe(user=self.user, title='Aubergine with Tahini')
-        ingredient1 = Ingredient.objects.create(user=self.user, name='Pepper')
-        ingredient2 = Ingredient.objects.create(user=self.user, name='Salt')
+        recipe3 = create_recipe(user=self.user, title='Lemon')
+        ingredient1 = self.ingredient_pepper
+        ingredient2 = self.ingredient_salt
         recipe1.ingredients.add(ingredient1)
         recipe2.ingredients.add(ingredient2)
-        recipe3 = create_recipe(user=self.user, title='Lemon')
 
         params = {'ingredients': f'{ingredient1.id},{ingredient2.id}'}
-        response = self.client.get(RECIPES_URL, params)
-
-        serializer1 = RecipeSerializer(recipe1)
-        serializer2 = RecipeSerializer(recipe2)
-        serializer3 = RecipeSerializer(recipe3)
-        self.assertIn(serializer1.data, response.data)
-        self.assertIn(serializer2.data, response.data)
-        self.assertNotIn(serializer3.data, response.data)
+        with self.assertNumQueries(3):
+            response = self.client.get(RECIPES_URL, params)
+
+        serializer = RecipeSerializer([recipe1, recipe2, recipe3], many=True)
+        recipe1_data, recipe2_data, recipe3_data = serializer.data
+        self.assertIn(recipe1_data, response.data)
+        self.assertIn(recipe2_data, response.data)
+        self.assertNotIn(recipe3_data, response.data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
 
+@override_settings(PASSWORD_HASHERS=MD5_PASSWORD_HASHERS)
 class ImageUploadTests(TestCase):
     """Tests for the image upload API."""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = create_user(
+    @classmethod
+    def setUpClass(cls):
+        media_root = tempfile.mkdtemp(prefix='mediatest-', dir=MEDIA_TEST_DIR)
+        cls.addClassCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        media_settings = override_settings(MEDIA_ROOT=media_root)
+        media_settings.enable()
+        cls.addClassCleanup(media_settings.disable)
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email='image_user@example.com',
             password='testpass123',
         )
-        self.client.force_authenticate(self.user)
+        cls._client = APIClient()
+        cls._client.force_authenticate(cls.user)
+
+    def setUp(self):
+        self.client = type(self)._client
         self.recipe = create_recipe(user=self.user)
 
     def tearDown(self):
@@ -469,12 +552,9 @@ class ImageUploadTests(TestCase):
     def test_upload_image(self):
         """Test uploading an image to a recipe."""
         url = image_upload_url(self.recipe.id)
-        with tempfile.NamedTemporaryFile(suffix='.jpg') as image_file:
-            image = Image.new('RGB', (10, 10))  # in memory
-            image.save(image_file, format='JPEG')  # in temporary directory
-            image_file.seek(0)  # get the temporary file to directory to upload
-            payload = {'image': image_file}
-            response = self.client.post(url, payload, format='multipart')
+        image_file = SimpleUploadedFile('image.jpg', _TINY_JPEG, 'image/jpeg')
+        payload = {'image': image_file}
+        response = self.client.post(url, payload, format='multipart')
 
         self.recipe.refresh_from_db()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -66,10 +66,15 @@ class RecipeViewSet(viewsets.ModelViewSet):
             ingredients_ids = self._params_to_ints(ingredients)
             queryset = queryset.filter(ingredients__id__in=ingredients_ids)
 
-        return queryset.filter(
+        queryset = queryset.filter(
             user=self.request.user
         ).order_by('-id').distinct()
 
+        if self.action in ['list', 'retrieve']:
+            queryset = queryset.prefetch_related('tags', 'ingredients')
+
+        return queryset
+
     def get_serializer_class(self):
         """Return the serializer class for request."""
         if self.action == 'list':